@@ -2,9 +2,13 @@
 核心代码
 """
 
+import functools
+import itertools
 import re
-import xml
+import threading
+import xml.etree.ElementTree as etree
 
+from concurrent.futures import Executor, ProcessPoolExecutor
 from typing import *
 
 import markdown.core
@@ -42,17 +46,73 @@ import kbdextension
 import markdown_gfm_admonition
 from markdown_include.include import MarkdownInclude
 
-from xml.etree.ElementTree import ElementTree
-
 Variable = dict[str, str | tuple[str], list[str]] | None
 
+# 对话中的非空行
+_LINE_RE = re.compile(r'.+')
+
+
+def _split_dialogue(line: str) -> tuple[str, str, str] | None:
+    """
+    将对话行拆分为(角色, 分隔符, 台词),等价于正则表达式(.+?)([<>]+)(.+),但保证线性时间
+    :param line: 单行对话文本
+    :return: 拆分结果,不是对话时返回None
+    """
+    left, right = line.find('>', 1), line.find('<', 1)  # 角色至少一个字符,从第二个字符开始查找
+    index = min(left, right) if left >= 0 and right >= 0 else max(left, right)  # 第一个分隔符的位置
+    if index < 0 or index == len(line) - 1:  # 没有分隔符或分隔符后没有台词
+        return None
+    end = index + 1
+    while end < len(line) and line[end] in '<>':  # 分隔符取连续的全部<>
+        end += 1
+    if end == len(line):  # 分隔符后必须留有台词
+        end -= 1
+    return line[:index], line[index:end], line[end:]
+
+
+# 分隔符对应的(方向, 类型)
+_DIALOGUE_STYLES = {
+    '>': ('左', '普通'),
+    '<': ('右', '普通'),
+    '>>': ('左', '心理'),
+    '<<': ('右', '心理'),
+}
+
+# 方向对应的(左侧类名, 右侧类名, 左侧显示角色, 右侧显示角色)
+_DIALOGUE_DIRECTIONS = {
+    '左': ('user-name left', 'user-name', True, False),
+    '右': ('user-name', 'user-name right', False, True),
+    '中': ('user-name', 'user-name', False, False),
+}
+
+# 基本样式的正则表达式,在模块加载时编译一次,编译选项与InlineProcessor一致
+_NEST_UP = re.compile(r'\[(.*?)]\^\((.*?)\)', re.DOTALL | re.UNICODE)  # [文本]^(上方文本)
+_ID_HIDE = re.compile(r'\[(.*?)]-\((.*?)\)', re.DOTALL | re.UNICODE)  # [文本]-(隐藏文本)
+
+
+class Precompiled(InlineProcessor):
+    """
+    可直接使用已编译正则表达式的行内处理器
+    """
+
+    def __init__(self, pattern: str | Pattern[str]):
+        """
+        初始化
+        :param pattern: 正则表达式,已编译时直接使用该对象
+        """
+        if isinstance(pattern, str):
+            super().__init__(pattern)
+        else:
+            super().__init__(pattern.pattern)  # 由InlineProcessor完成其余初始化,相同的正则表达式会命中re模块的缓存
+            self.compiled_re = pattern
+
 
-class Simple(InlineProcessor):
+class Simple(Precompiled):
     """
     可通过简单的正则表达式和HTML标签实现的样式
     """
 
-    def __init__(self, pattern: str, tag: str):
+    def __init__(self, pattern: str | Pattern[str], tag: str):
         """
         初始化
         :param pattern: 正则表达式
@@ -61,26 +121,26 @@ class Simple(InlineProcessor):
         super().__init__(pattern)
         self.tag = tag
 
-    def handleMatch(self, m: Match[str], data: str) -> (tuple[xml.etree.ElementTree.Element, int, int] |
-                                                        tuple[None, None, None]):
+    def handleMatch(self, m: Match[str], data: str) -> tuple[etree.Element, int, int]:
         """
         处理匹配
         :param m: re模块的匹配对象
         :param data: 被匹配的原始文本
         :return: 标签 匹配开始 匹配结束
         """
-        tag = xml.etree.ElementTree.Element(self.tag)  # 创建标签
+        tag = etree.Element(self.tag)  # 创建标签
         tag.text = m.group(1)  # 获取匹配到的文本并设置为标签的内容
 
-        return tag, m.start(), m.end()
+        start, end = m.span()
+        return tag, start, end
 
 
-class Nest(InlineProcessor):
+class Nest(Precompiled):
     """
     需要嵌套HTML标签实现的样式
     """
 
-    def __init__(self, pattern: str, outer_tag: str, inner_tag: str):
+    def __init__(self, pattern: str | Pattern[str], outer_tag: str, inner_tag: str):
         """
         初始化
         :param pattern: 正则表达式
@@ -91,28 +151,29 @@ class Nest(InlineProcessor):
         self.outer_tag = outer_tag
         self.inner_tag = inner_tag
 
-    def handleMatch(self, m: Match[str], data: str) -> (tuple[xml.etree.ElementTree.Element, int, int] |
-                                                        tuple[None, None, None]):
+    def handleMatch(self, m: Match[str], data: str) -> tuple[etree.Element, int, int]:
         """
         处理匹配
         :param m: re模块的匹配对象
         :param data: 被匹配的原始文本
         :return: 标签 匹配开始 匹配结束
         """
-        outer_tag = xml.etree.ElementTree.Element(self.outer_tag)  # 创建外层标签
-        inner_tag = xml.etree.ElementTree.SubElement(outer_tag, self.inner_tag)  # 创建内层标签
-        outer_tag.text = m.group(1)  # 设置外层标签文本
-        inner_tag.text = m.group(2)  # 设置内层标签文本
+        outer_text, inner_text = m.group(1, 2)
+        outer_tag = etree.Element(self.outer_tag)  # 创建外层标签
+        inner_tag = etree.SubElement(outer_tag, self.inner_tag)  # 创建内层标签
+        outer_tag.text = outer_text  # 设置外层标签文本
+        inner_tag.text = inner_text  # 设置内层标签文本
 
-        return outer_tag, m.start(), m.end()
+        start, end = m.span()
+        return outer_tag, start, end
 
 
-class ID(InlineProcessor):
+class ID(Precompiled):
     """
     需要对HTML标签设置ID实现的样式
     """
 
-    def __init__(self, pattern: str, tag: str, property_: str, value: str | bool = None):
+    def __init__(self, pattern: str | Pattern[str], tag: str, property_: str, value: str | bool = None):
         """
         初始化
         :param pattern: 正则表达式
@@ -125,43 +186,46 @@ class ID(InlineProcessor):
         self.property = property_
         self.value = value
 
-    def handleMatch(self, m: Match[str], data: str) -> (tuple[xml.etree.ElementTree.Element, int, int] |
-                                                        tuple[None, None, None]):
+    def handleMatch(self, m: Match[str], data: str) -> tuple[etree.Element, int, int]:
         """
         处理匹配
         :param m: re模块的匹配对象
         :param data: 被匹配的原始文本
         :return: 标签 匹配开始 匹配结束
         """
-        tag = xml.etree.ElementTree.Element(self.tag)  # 创建标签
-        tag.text = m.group(1)  # 设置标签内容
-        tag.set(self.property, m.group(2) if self.value is None else self.value)  # 设置标签属性,属性的值默认为第二个匹配组
+        text, value = m.group(1, 2)
+        tag = etree.Element(self.tag)  # 创建标签
+        tag.text = text  # 设置标签内容
+        tag.set(self.property, value if self.value is None else self.value)  # 设置标签属性,属性的值默认为第二个匹配组
 
-        return tag, m.start(), m.end()
+        start, end = m.span()
+        return tag, start, end
 
 
 class Syllabus(BlockProcessor):
     # 定义提纲的正则表达式
-    syllabus_re = r'(\d+(\.\d+)*)\s+(.*)'
+    syllabus_re = re.compile(r'(\d+(\.\d+)*)\s+(.*)')
 
-    def test(self, parent: xml.etree.ElementTree.Element, block: str) -> Match[str] | None | bool:
+    def test(self, parent: etree.Element, block: str) -> Match[str] | None | bool:
         """
         检查当前块是否匹配正则表达式
         :param parent: 当前块的Element对象
         :param block: 当前块的内容
         :return: 匹配成功与否
         """
-        return re.match(self.syllabus_re, block)
+        if not block[:1].isdecimal():  # 提纲以数字开头,其余块无需进入正则表达式
+            return None
+        return self.syllabus_re.match(block)
 
-    def run(self, parent: xml.etree.ElementTree.Element, blocks: list[str]) -> bool | None:
+    def run(self, parent: etree.Element, blocks: list[str]) -> bool | None:
         """
         对匹配到的块进行处理
         :param parent: 当前块的Element对象
         :param blocks: 包含文本中剩余块的列表
         :return: 匹配成功与否
         """
-        syllabus = re.match(self.syllabus_re, blocks[0])  # 匹配提纲的号和内容
-        header = xml.etree.ElementTree.SubElement(parent, f'h{len(syllabus.group(1).split("."))}')  # 按照提纲号等级创建标题
+        syllabus = self.syllabus_re.match(blocks[0])  # 匹配提纲的号和内容
+        header = etree.SubElement(parent, f'h{syllabus.group(1).count(".") + 1}')  # 按照提纲号等级创建标题
         header.set('id', syllabus.group(1))  # 设置提纲ID
         header.text = syllabus.group(1) + ' ' + syllabus.group(3)  # 设置提纲内容
         blocks[0] = ''
@@ -173,7 +237,7 @@ class DialogueParser:
     解析对话
     """
 
-    def __init__(self, dialogue: str, title: str, block: xml.etree.ElementTree.Element):
+    def __init__(self, dialogue: str, title: str, block: etree.Element):
         """
         初始化
         :param dialogue: 原始对话文本
@@ -183,8 +247,8 @@ class DialogueParser:
         self.dialogue = dialogue
         self.title = title
         self.block = block
-        self.title = xml.etree.ElementTree.SubElement(self.block, 'div')
-        self.box = xml.etree.ElementTree.SubElement(self.block, 'div')
+        self.title = etree.SubElement(self.block, 'div')
+        self.box = etree.SubElement(self.block, 'div')
 
     def __call__(self, *args, **kwargs):
         # 创建一个对话框
@@ -192,56 +256,56 @@ class DialogueParser:
         self.title.set('class', 'message-title')
         # 创建主体
         self.box.set('class', 'dialog-container')
-        # 添加对话
-        for block_ in self.block.text.split('\n'):
-            self.lines(block_)
-        xml.etree.ElementTree.SubElement(self.block, 'br')  # 添加强制换行符,防止格式错乱
-
-    def lines(self, line):
-        if line == '':
-            return
-        try:
-            line = re.compile(r'(.+?)([<>]+)(.+)').match(line).groups()  # 尝试解析对话
-        except AttributeError:  # 处理旁白
-            self.line('中', '', line)
-        else:
-            match line:
-                case charactor, '>', dialogue:
-                    self.line('左', charactor, dialogue)
-                case charactor, '<', dialogue:
-                    self.line('右', charactor, dialogue)
-                case charactor, '>>', dialogue:
-                    self.line('左', charactor, dialogue, '心理')
-                case charactor, '<<', dialogue:
-                    self.line('右', charactor, dialogue, '心理')
-                case _:
-                    pass
+        # 解析对话,先得到所有话语行
+        rows = []
+        for block_ in _LINE_RE.finditer(self.block.text):  # 逐行读取,跳过空行
+            row = self.lines(block_.group())
+            if row is not None:
+                rows.append(row)
+        # 添加对话,一次性创建所有话语行的标签
+        for row in rows:
+            self.line(*row)
+        etree.SubElement(self.block, 'br')  # 添加强制换行符,防止格式错乱
+
+    def lines(self, line: str) -> tuple[Literal['左', '中', '右'], str, str, Literal['普通', '心理']] | None:
+        """
+        解析一行对话
+        :param line: 单行对话文本
+        :return: (方向, 角色, 话语, 类型),无需显示时返回None
+        """
+        if (parts := _split_dialogue(line)) is None:  # 处理旁白
+            return '中', '', line, '普通'
+        charactor, delimiter, dialogue = parts  # 解析对话
+        if (style := _DIALOGUE_STYLES.get(delimiter)) is not None:
+            return style[0], charactor, dialogue, style[1]
+        return None
 
     def line(self, direction: Literal['左', '中', '右'], charactor: str, text: str, type_: Literal['普通', '心理'] = '普通'):
         # 创建话语行
-        dialogue = xml.etree.ElementTree.SubElement(self.box, 'div')
+        dialogue = etree.SubElement(self.box, 'div')
         dialogue.set('class', 'dialog-row')
 
         # 左侧用户
-        left = xml.etree.ElementTree.SubElement(dialogue, 'div')
-        left.set('class', f'user-name {'left' if direction == '左' else ''}')
-        if direction == '左':
+        left = etree.SubElement(dialogue, 'div')
+        left_class, right_class, left_name, right_name = _DIALOGUE_DIRECTIONS[direction]
+        left.set('class', left_class)
+        if left_name:
             left.text = charactor
 
         # 中间话语
-        middle = xml.etree.ElementTree.SubElement(dialogue, 'div')
+        middle = etree.SubElement(dialogue, 'div')
         middle.set('class', 'message-content')
         if type_ == '普通':
             middle.text = text
         elif type_ == '心理':
-            mental = xml.etree.ElementTree.SubElement(middle, 'p')
+            mental = etree.SubElement(middle, 'p')
             mental.set('class', 'thought')
             mental.text = text
 
         # 右侧用户
-        right = xml.etree.ElementTree.SubElement(dialogue, 'div')
-        right.set('class', f'user-name {'right' if direction == '右' else ''}')
-        if direction == '右':
+        right = etree.SubElement(dialogue, 'div')
+        right.set('class', right_class)
+        if right_name:
             right.text = charactor
 
 
@@ -251,12 +315,12 @@ class DialogueBlock(Block):
     OPTIONS = {}
 
     def on_create(self, parent):
-        return xml.etree.ElementTree.SubElement(parent, 'div')
+        return etree.SubElement(parent, 'div')
 
     def on_markdown(self) -> str:
         return 'raw'
 
-    def on_end(self, block: xml.etree.ElementTree.Element):
+    def on_end(self, block: etree.Element):
         DialogueParser(block.text, self.argument, block)()
         block.text = ''  # 清空块的内容
 
@@ -273,10 +337,10 @@ class BasicExtension(Extension):
         """
         md.registerExtension(self)  # 注册扩展
         md.inlinePatterns.register(Nest(
-            r'\[(.*?)]\^\((.*?)\)', outer_tag='ruby', inner_tag='rt'), 'up', 179
+            _NEST_UP, outer_tag='ruby', inner_tag='rt'), 'up', 179
         )  # [在文本的正上方添加一行小文本]^(主要用于标拼音)
         md.inlinePatterns.register(ID(
-            r'\[(.*?)]-\((.*?)\)', tag='span', property_='title'), 'hide', 180
+            _ID_HIDE, tag='span', property_='title'), 'hide', 180
         )  # [在指定的文本里面隐藏一段文本]-(只有鼠标放在上面才会显示隐藏文本)
         md.parser.blockprocessors.register(Syllabus(md.parser), 'syllabus', 182)  # 渲染提纲
 
@@ -299,7 +363,7 @@ class InlineCode:
         self.variable = variable
 
     def __call__(self, source: str, language: str, css_class: str,
-                 md: markdown.core.Markdown) -> str | ElementTree:  # 自定义的单行代码格式化器
+                 md: markdown.core.Markdown) -> str | etree.ElementTree:  # 自定义的单行代码格式化器
         """
         InlineHiliteExtension的自定义格式化器
         :param source: 原始单行代码
@@ -314,16 +378,15 @@ class InlineCode:
                 md=md
             )  # 调用默认格式化函数
 
-        match re.compile(r'([#-])?(.*)').match(source).groups():  # 将字符串拆分为(标志, 值)的形式
-            case '#', archer:  # 匹配到`#锚点`
+        match source[:1]:  # 按首字符区分(标志, 值)
+            case '#':  # 匹配到`#锚点`
+                archer = source[1:]
                 return f'<span id="{archer}">{archer}</span>'
-            case '-', inline_link:  # 匹配到`-行内链接`
+            case '-':  # 匹配到`-行内链接`
+                inline_link = source[1:]
                 return f'<a href=#{inline_link}>{inline_link}</a>'
-            case None, variable:  # 可能匹配到`变量`
-                if variable in self.variable:  # 是`变量`
-                    return f'<code id="block">{self.variable[variable]}</code>'
-                else:  # 不是`变量`
-                    return f'<code id="block">{variable}</code>'
+            case _:  # 可能匹配到`变量`,不是`变量`时原样输出
+                return f'<code id="block">{self.variable.get(source, source)}</code>'
 
 
 def dialogue_formatter(
@@ -353,80 +416,166 @@ def dialogue_formatter(
     return f'<canvas></canvas><script>{source}</script>'
 
 
-Extensions = {
-    # 自带
-    '元数据': meta.MetaExtension(),
-    '目录': toc.TocExtension(),
-    '内部链接': wikilinks.WikiLinkExtension(),
-    '属性设置': legacy_attrs.LegacyAttrExtension(),
-
-    # pymdownx
-    '基本扩展': ExtraExtension(configs={
-        'pymdownx.superfences': {
-            'custom_fences': [  # 渲染mermaid
-                {
-                    'name': 'mermaid',
-                    'class': 'mermaid',
-                    'format': fence_div_format,
-                },
-                {
-                    'name': 'dialogue',
-                    'class': 'dialogue',
-                    'format': dialogue_formatter,
-                }
-            ]
-        },
-    }),
-    '超级数学': ArithmatexExtension(),
-    'EMOJI': EmojiExtension(),
-    '块扩展': BlocksExtension(),
-    '警告': AdmonitionExtension(),
-    '详情': DetailsExtension(),
-    'HTML': HTMLExtension(),
-    '标签': TabExtension(),
-    '批评': CriticExtension(),
-    '代码高亮': HighlightExtension(),
-    '按键风格': KeysExtension(),
-    '高亮': MarkExtension(),
-    '进度条': ProgressBarExtension(),
-    '高级符号': SmartSymbolsExtension(),
-    '任务列表': TasklistExtension(clickable_checkbox=True),
-    '下标': DeleteSubExtension(),
-    '上标': InsertSupExtension(),
-    '高级列表': FancyListExtension(),
-    '高级标题': SaneHeadersExtension(),
-    '超级链接': MagiclinkExtension(),
-    '路径转换器': PathConverterExtension(),
-
-    # 其它
-    'KBD': kbdextension.KbdExtension(),
-    'GFM 警告': markdown_gfm_admonition.GfmAdmonitionExtension(),
-    '嵌套MD': MarkdownInclude(),
-
-    # 自定义
-    '基本风格': BasicExtension(),
-    '对话': DialogueExtension(),
-}
+def _build_extensions() -> dict[str, Extension]:
+    """
+    创建一套新的扩展实例,扩展在注册时会保存转换器的状态,因此每个转换器需要独立的一套
+    :return: 扩展名称与扩展实例
+    """
+    return {
+        # 自带
+        '元数据': meta.MetaExtension(),
+        '目录': toc.TocExtension(),
+        '内部链接': wikilinks.WikiLinkExtension(),
+        '属性设置': legacy_attrs.LegacyAttrExtension(),
+
+        # pymdownx
+        '基本扩展': ExtraExtension(configs={
+            'pymdownx.superfences': {
+                'custom_fences': [  # 渲染mermaid
+                    {
+                        'name': 'mermaid',
+                        'class': 'mermaid',
+                        'format': fence_div_format,
+                    },
+                    {
+                        'name': 'dialogue',
+                        'class': 'dialogue',
+                        'format': dialogue_formatter,
+                    }
+                ]
+            },
+        }),
+        '超级数学': ArithmatexExtension(),
+        'EMOJI': EmojiExtension(),
+        '块扩展': BlocksExtension(),
+        '警告': AdmonitionExtension(),
+        '详情': DetailsExtension(),
+        'HTML': HTMLExtension(),
+        '标签': TabExtension(),
+        '批评': CriticExtension(),
+        '代码高亮': HighlightExtension(),
+        '按键风格': KeysExtension(),
+        '高亮': MarkExtension(),
+        '进度条': ProgressBarExtension(),
+        '高级符号': SmartSymbolsExtension(),
+        '任务列表': TasklistExtension(clickable_checkbox=True),
+        '下标': DeleteSubExtension(),
+        '上标': InsertSupExtension(),
+        '高级列表': FancyListExtension(),
+        '高级标题': SaneHeadersExtension(),
+        '超级链接': MagiclinkExtension(),
+        '路径转换器': PathConverterExtension(),
+
+        # 其它
+        'KBD': kbdextension.KbdExtension(),
+        'GFM 警告': markdown_gfm_admonition.GfmAdmonitionExtension(),
+        '嵌套MD': MarkdownInclude(),
+
+        # 自定义
+        '基本风格': BasicExtension(),
+        '对话': DialogueExtension(),
+    }
+
+
+@functools.cache
+def _extensions() -> dict[str, Extension]:
+    """
+    在第一次使用时创建模块属性Extensions,避免导入模块时就实例化
+    Extensions是main使用的扩展,增删其中的扩展会在下一次调用main时生效
+    其中的扩展实例属于main的转换器,不要再传给Renderer
+    :return: 扩展名称与扩展实例
+    """
+    return _build_extensions()
+
+
+def __getattr__(name: str):
+    """
+    延迟创建模块属性Extensions
+    :param name: 属性名称
+    :return: 属性值
+    """
+    if name == 'Extensions':  # 所有扩展
+        return _extensions()
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
+
+
+class Renderer:
+    """
+    持有一个已注册扩展的转换器,用于批量渲染多个文档
+    """
+
+    def __init__(self, extensions: Iterable[Extension | str] | None = None):
+        """
+        初始化,只在此处创建一次转换器
+        :param extensions: 使用的扩展,默认为新建的一套全部扩展
+            扩展在注册时会保存转换器的状态,传入的扩展实例不能同时用于其它转换器
+        """
+        if extensions is None:
+            extensions = _build_extensions().values()
+        self._lock = threading.Lock()  # 转换器在渲染期间保存状态,同一时间只能渲染一个文档
+        self._inline_code = InlineCode(variable={})
+        self.md = Markdown(extensions=list(extensions) + [
+            InlineHiliteExtension(
+                custom_inline=[
+                    {
+                        'name': '*',
+                        'class': 'block',
+                        'format': self._inline_code,  # 变量在每次渲染时传入
+                    },
+                ]
+            ),
+        ])
+
+    def render(self, text: str, variable: Variable = None) -> tuple[str, Variable]:
+        """
+        渲染一个文档
+        :param text: 输入文本
+        :param variable: 变量字典
+        :return: 返回html与元数据字典
+        """
+        with self._lock:  # 多个线程共用同一个渲染器时,避免互相覆盖变量与转换器状态
+            self._inline_code.variable = {} if variable is None else variable  # 传入变量
+            self.md.reset()
+            return self.md.convert(text), getattr(self.md, 'Meta', {})  # 未使用元数据扩展时没有Meta
+
+
+_main_lock = threading.Lock()  # main的转换器与Extensions中的扩展实例同一时间只能被一次调用使用
+
+
+@functools.lru_cache(maxsize=1)
+def _renderer(extensions: tuple[Extension, ...]) -> Renderer:
+    """
+    获取main使用的共享渲染器,Extensions中的扩展有增删时重新创建
+    :param extensions: Extensions中当前的扩展实例
+    :return: 渲染器
+    """
+    return Renderer(extensions)
 
 
 def main(text: str, variable: Variable = None) -> tuple[str, Variable]:
     """
-    主函数
+    主函数,使用Extensions中的扩展,所有线程共用一个渲染器,并发调用时会依次渲染
     :param text: 输入文本
     :param variable: 变量字典
     :return: 返回html与元数据字典
     """
-    if variable is None:
-        variable = {}
-    md = Markdown(extensions=list(Extensions.values()) + [
-        InlineHiliteExtension(
-            custom_inline=[
-                {
-                    'name': '*',
-                    'class': 'block',
-                    'format': InlineCode(variable=variable),  # 传入变量
-                },
-            ]
-        ),
-    ])
-    return md.convert(text), md.Meta
+    with _main_lock:
+        return _renderer(tuple(_extensions().values())).render(text, variable)
+
+
+def render_many(texts: Iterable[str], variable: Variable = None, max_workers: int | None = None,
+                chunksize: int = 16, executor: Executor | None = None) -> list[tuple[str, Variable]]:
+    """
+    使用多进程并行渲染多个文档,每个进程在第一次渲染时创建自己的渲染器
+    在以spawn方式创建进程的平台(Windows, macOS)上,调用它的脚本必须放在if __name__ == '__main__':之下
+    :param texts: 输入文本
+    :param variable: 所有文档共用的变量字典
+    :param max_workers: 最大进程数,默认为CPU核心数,传入executor时无效
+    :param chunksize: 每次发送给一个进程的文档数,减少进程间通信的次数
+    :param executor: 复用的进程池,多次调用时传入可避免每次重新创建进程与渲染器
+    :return: 按输入顺序返回每个文档的html与元数据字典
+    """
+    if executor is not None:
+        return list(executor.map(main, texts, itertools.repeat(variable), chunksize=chunksize))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(main, texts, itertools.repeat(variable), chunksize=chunksize))
@@ -1,9 +1,12 @@
 from typing import *
 import pickle
-from .Core import main, Variable, Syllabus, InlineCode, Extensions
+from . import Core
+from .Core import main, Renderer, render_many, Variable, Syllabus, InlineCode
 
 __all__ = [
     'main',  # 主函数
+    'Renderer',  # 批量渲染器
+    'render_many',  # 多进程批量渲染
     'indent',  # 添加空格
     'HEAD',  # HTML头部引用
     'Meta',  # 元数据处理器
@@ -76,3 +79,14 @@ class Meta:
 
         with open(long_description, "r") as fh:
             self.long_description = fh.read()
+
+
+def __getattr__(name: str):
+    """
+    延迟获取Extensions,导入本模块时不创建扩展,实际的创建与缓存由Core.__getattr__完成
+    :param name: 属性名称
+    :return: 属性值
+    """
+    if name == 'Extensions':  # 所有扩展
+        return Core.Extensions
+    raise AttributeError(f'module {__name__!r} has no attribute {name!r}')
@@ -0,0 +1,55 @@
+"""
+核心代码测试
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from CrossDown import Core, main, Renderer, render_many
+
+
+@pytest.mark.parametrize('text, html', [
+    # 嵌套样式
+    ('[[a]^(b)]-(c)', '<p><span title="c"><ruby>a<rt>b</rt></ruby></span></p>'),
+    ('[[x]-(y)]^(z)', '<p><span title="y">[x</span>]^(z)</p>'),
+    # 方括号内含有]
+    ('[a]b]^(c)', '<p><ruby>a]b<rt>c</rt></ruby></p>'),
+    ('[a] b [c]^(d)', '<p><ruby>a] b [c<rt>d</rt></ruby></p>'),
+    # 同一行中的多种样式
+    ('[c]-(d) [a]^(b)', '<p><span title="d">c</span> <ruby>a<rt>b</rt></ruby></p>'),
+    ('[a]^(b) [c]-(d)', '<p><span title="d">a]^(b) [c</span></p>'),
+])
+def test_basic_styles(text, html):
+    assert main(text)[0] == html
+
+
+def test_basic_pattern_names():
+    md = Renderer().md
+    assert md.inlinePatterns.get_index_for_name('hide') < md.inlinePatterns.get_index_for_name('up')
+    md.inlinePatterns.deregister('hide')
+    assert md.convert('[x]-(y)') == '<p>[x]-(y)</p>'
+
+
+def test_renderer_extensions():
+    renderer = Renderer(extensions=[Core.BasicExtension()])
+    assert renderer.render('[a]^(b) `v`', {'v': 'x'})[0] == \
+        '<p><ruby>a<rt>b</rt></ruby> <code id="block">x</code></p>'
+    assert renderer.render('# t')[0] == '<h1>t</h1>'  # 未使用目录扩展,标题没有ID
+
+
+def test_extensions_subset():
+    extensions = Core.Extensions
+    basic = extensions.pop('基本风格')
+    try:
+        assert main('[a]^(b)')[0] == '<p>[a]^(b)</p>'
+    finally:
+        extensions['基本风格'] = basic
+    assert main('[a]^(b)')[0] == '<p><ruby>a<rt>b</rt></ruby></p>'
+
+
+def test_render_many():
+    texts = [f'# {i}\n\n`v`' for i in range(40)]
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        results = render_many(texts, {'v': 'x'}, chunksize=8, executor=executor)
+    assert results == [main(text, {'v': 'x'}) for text in texts]